@@ -3,15 +3,169 @@ import os
 import re
 import sys
 import json
+import hashlib
 import subprocess
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+from functools import lru_cache
+
+try:
+    # C実装のAPNG分解（apngasm-python）。チャンク解析のループが
+    # C側で走るため、PILのseekループよりフレーム抽出が速い
+    from apngasm_python.apngasm import APNGAsmBinder as _APNGAsmBinder
+except ImportError:
+    _APNGAsmBinder = None
+
+try:
+    # あればAPNGフレームの転送をゼロコピーにするために使う
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    # PyObjCがあればFinder表示をプロセス起動なしのCocoa直接呼び出しで
+    # 行える（osascriptはコンパイル済みでも起動に数百msかかる）
+    from AppKit import NSURL as _NSURL, NSWorkspace as _NSWorkspace
+except ImportError:
+    _NSWorkspace = None
+
+try:
+    # C実装のJSON。設定とAPNGサイドカーの読み書きに使う
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+try:
+    # 巨大グループの中間番号グループ化をC側のベクトル処理に回すために使う
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+
+def _json_loads(data):
+    """orjsonがあればそちらでパースする（bytes/strどちらも可）"""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    if isinstance(data, bytes):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
 from PySide6 import QtWidgets, QtCore, QtGui, QtMultimedia, QtMultimediaWidgets
 from PIL import Image
 import io
 
 
+# 対応する画像拡張子（小文字）
+_VALID_EXTS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp"})
+
+# 自然順ソート用の数値分割パターン（呼び出しごとのreキャッシュ参照を省く）
+_NUM_SPLIT = re.compile(r"(\d+)").split
+
+
+# APNG判定のサイドカーキャッシュ。(mtime, サイズ)が一致する限り
+# 起動をまたいで判定結果を再利用できる
+_APNG_SIDECAR_PATH = (
+    Path.home() / ".cache" / "image_group_navigator" / "apng_cache.json"
+)
+_apng_disk_cache = None
+_apng_disk_dirty = False
+
+
+def _load_apng_disk_cache():
+    """サイドカーキャッシュを初回参照時に読み込む"""
+    global _apng_disk_cache
+    if _apng_disk_cache is None:
+        try:
+            _apng_disk_cache = _json_loads(_APNG_SIDECAR_PATH.read_bytes())
+        except (OSError, ValueError):
+            _apng_disk_cache = {}
+    return _apng_disk_cache
+
+
+def _save_apng_disk_cache():
+    """APNG判定結果をサイドカーへ書き出す（変更があった場合のみ）"""
+    global _apng_disk_dirty
+    if not _apng_disk_dirty or _apng_disk_cache is None:
+        return
+    try:
+        _APNG_SIDECAR_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if _orjson is not None:
+            _APNG_SIDECAR_PATH.write_bytes(_orjson.dumps(_apng_disk_cache))
+        else:
+            with open(_APNG_SIDECAR_PATH, "w", encoding="utf-8") as f:
+                json.dump(_apng_disk_cache, f)
+        _apng_disk_dirty = False
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=4096)
+def _is_apng_file(filepath):
+    """PNGがAPNGかどうかを先頭チャンクの読み取りだけで判定する
+
+    APNGのacTLチャンクは仕様上IDATより前に置かれるため、ファイル先頭の
+    数KBを読むだけで判定できる。PILでの全ヘッダ解析より大幅に軽い。
+    結果はメモリ上はLRU、ディスク上は(mtime, サイズ)付きのサイドカーに
+    キャッシュされ、次回起動時は読み取りすら省略される。
+    """
+    global _apng_disk_dirty
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return False
+
+    disk = _load_apng_disk_cache()
+    entry = disk.get(filepath)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+        return entry[2]
+
+    try:
+        with open(filepath, "rb") as f:
+            head = f.read(4096)
+        actl = head.find(b"acTL")
+        idat = head.find(b"IDAT")
+        if actl == -1 and idat == -1:
+            # 先頭4KBにどちらのチャンクも現れない珍しい構成はPILに任せる
+            try:
+                with Image.open(filepath) as img:
+                    result = bool(getattr(img, "is_animated", False))
+            except Exception:
+                result = False
+        else:
+            result = actl != -1 and (idat == -1 or actl < idat)
+    except OSError:
+        return False
+
+    disk[filepath] = [st.st_mtime_ns, st.st_size, result]
+    _apng_disk_dirty = True
+    return result
+
+
+def _extract_middle_number(name):
+    """ファイル名から中間番号を抽出"""
+    # partition2回でリストを作らずに2番目のフィールドだけ取り出す。
+    # sepが空なら区切りが2つ未満なので中間番号なし
+    rest = name.partition("_")[2]
+    mid, sep, _ = rest.partition("_")
+    return mid if sep else ""
+
+
+@lru_cache(maxsize=8192)
+def natural_key(s):
+    """自然順ソート用キー（ファイル名ごとに結果をキャッシュ）"""
+    # re.splitの結果は奇数インデックスが必ず数値チャンクになるため、
+    # チャンクごとの判定なしでまとめてintへ変換できる。タプルで返すと
+    # 比較が速く、キャッシュから共有されても書き換えられない
+    parts = _NUM_SPLIT(s)
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
 class ShortcutManager:
     """ショートカットキー管理クラス"""
 
@@ -37,11 +191,15 @@ class ShortcutManager:
 
     def __init__(self):
         self.shortcuts = self.DEFAULT_SHORTCUTS.copy()
+        # アクション名 -> (キー, 修飾キー, 英字キーか) の事前変換テーブル
+        self._compiled = {}
+        self._compile_all()
 
     def load_from_config(self, config):
         """設定から読み込み"""
         if "shortcuts" in config:
             self.shortcuts.update(config["shortcuts"])
+            self._compile_all()
 
     def save_to_config(self, config):
         """設定に保存"""
@@ -54,14 +212,20 @@ class ShortcutManager:
     def set_key_sequence(self, action, key_sequence):
         """アクションにキーシーケンスを設定"""
         self.shortcuts[action] = key_sequence
+        self._compile(action)
 
-    def matches_key_event(self, action, event):
-        """キーイベントが指定アクションと一致するかチェック"""
-        key_seq = self.get_key_sequence(action)
+    def _compile_all(self):
+        """全ショートカットを事前変換する"""
+        for action in self.shortcuts:
+            self._compile(action)
+
+    def _compile(self, action):
+        """ショートカット文字列をパースして変換テーブルへ登録"""
+        self._compiled.pop(action, None)
+        key_seq = self.shortcuts.get(action, "")
         if not key_seq:
-            return False
+            return
 
-        # キーシーケンスをパース
         parts = key_seq.split("+")
         required_modifiers = QtCore.Qt.NoModifier
         required_key = None
@@ -91,14 +255,26 @@ class ShortcutManager:
                 required_key = ord(part.upper())
 
         if required_key is None:
+            return
+
+        self._compiled[action] = (
+            required_key,
+            QtCore.Qt.KeyboardModifiers(required_modifiers),
+            ord("A") <= required_key <= ord("Z"),
+        )
+
+    def matches_key_event(self, action, event):
+        """キーイベントが指定アクションと一致するかチェック"""
+        compiled = self._compiled.get(action)
+        if compiled is None:
             return False
 
-        # イベントのキーとモディファイアをチェック
+        required_key, required_modifiers, is_letter = compiled
         event_key = event.key()
         event_modifiers = event.modifiers()
 
         # Shiftキーの特別処理（大文字判定）
-        if required_key in range(ord("A"), ord("Z") + 1):
+        if is_letter:
             # 大文字が要求されている場合
             if event_key == required_key and (
                 event_modifiers & QtCore.Qt.ShiftModifier
@@ -222,6 +398,386 @@ class DropPathLine(QtWidgets.QLineEdit):
         e.ignore()
 
 
+def _advise_willneed(paths):
+    """これから読むファイル群をOSの先読み対象としてヒントする
+
+    posix_fadvise(POSIX_FADV_WILLNEED)は実読み込みを伴わない軽い
+    システムコールで、デコード処理と並行してカーネルがページキャッシュ
+    へのプリフェッチを進めてくれる。macOSにposix_fadviseはないため
+    fcntl(F_RDADVISE)で代用する。どちらも使えないOSでは何もしない。
+    """
+    if hasattr(os, "posix_fadvise"):
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+        return
+
+    if sys.platform == "darwin":
+        import fcntl
+        import struct
+
+        # struct radvisory { off_t ra_offset; int ra_count; }
+        # F_RDADVISEは<sys/fcntl.h>の44（Pythonのfcntlモジュール未定義）
+        F_RDADVISE = 44
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                length = min(os.fstat(fd).st_size, 2**31 - 1)
+                fcntl.fcntl(fd, F_RDADVISE, struct.pack("@qi", 0, length))
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+
+# プレビュー用サムネイルのディスクキャッシュ。名前が(パス, mtime, サイズ)
+# から決まるため、元ファイルが変われば自然に無効化される
+_THUMB_DIR = Path.home() / ".cache" / "image_group_navigator" / "thumbs"
+_THUMB_SIZE = 512
+# これより小さい元ファイルはデコードが元々軽いのでサムネイルを作らない
+_THUMB_SOURCE_MIN_BYTES = 2 * 1024 * 1024
+
+
+def _thumb_path(filepath, st):
+    """サムネイルファイルのパスを決める"""
+    key = hashlib.sha1(
+        f"{filepath}|{st.st_mtime_ns}|{st.st_size}".encode()
+    ).hexdigest()
+    return _THUMB_DIR / f"{key}.jpg"
+
+
+def _read_preview_image(filepath, target_size):
+    """プレビュー向けデコード（表示が小さければディスクのサムネイルを使う）
+
+    巨大な元画像は縮小デコードでもMB単位の読み込みが要る。512px程度の
+    表示なら一度作ったサムネイルJPEGを読む方が桁違いに軽い。生成は
+    初回デコードのついでに行うため、ワーカースレッド1回分に収まる。
+    """
+    use_thumb = (
+        target_size is not None
+        and target_size.isValid()
+        and target_size.width() <= _THUMB_SIZE
+        and target_size.height() <= _THUMB_SIZE
+    )
+    if use_thumb:
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            st = None
+        if st is not None and st.st_size >= _THUMB_SOURCE_MIN_BYTES:
+            thumb = _thumb_path(filepath, st)
+            image = QtGui.QImage(str(thumb))
+            if not image.isNull():
+                return image
+
+            # サムネイル未生成。512px枠でデコードして保存し、それを返す
+            image = _read_scaled_image(
+                filepath, QtCore.QSize(_THUMB_SIZE, _THUMB_SIZE)
+            )
+            # 透過つきはJPEGにすると抜けが潰れるので保存しない
+            if not image.isNull() and not image.hasAlphaChannel():
+                try:
+                    _THUMB_DIR.mkdir(parents=True, exist_ok=True)
+                    image.save(str(thumb), "JPEG", 85)
+                except OSError:
+                    pass
+            return image
+
+    return _read_scaled_image(filepath, target_size)
+
+
+def _read_scaled_image(filepath, target_size=None):
+    """QImageReaderで必要サイズまで縮小しながらデコードする
+
+    縮小指定はlibjpegのIDCTダウンスケールなどデコーダ側で処理される
+    ため、フル解像度でデコードしてからscaledするより大幅に軽い。
+    target_sizeがNone、または元画像が収まるサイズなら等倍で読む。
+    """
+    reader = QtGui.QImageReader(filepath)
+    reader.setAutoTransform(True)
+    if target_size is not None and target_size.isValid():
+        size = reader.size()
+        if size.isValid() and (
+            size.width() > target_size.width()
+            or size.height() > target_size.height()
+        ):
+            size.scale(target_size, QtCore.Qt.KeepAspectRatio)
+            reader.setScaledSize(size)
+    return reader.read()
+
+
+class ImageCache:
+    """バイト予算で破棄するLRUキャッシュ
+
+    件数ベースのLRUだと、4KのAPNG1本で数百MBに膨らむ一方で小さな
+    JPEGなら余裕が残る、という値ごとの偏りを扱えない。エントリごとに
+    保持コスト（バイト換算）を見積もり、合計が予算を超えたら古い順に
+    破棄する。
+    """
+
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.cache = OrderedDict()  # key -> (value, cost)
+        self._total_cost = 0
+
+    @staticmethod
+    def _cost_of(value):
+        """値の保持コストをバイト換算で見積もる"""
+        if hasattr(value, "byte_cost"):
+            return value.byte_cost()
+        if isinstance(value, QtGui.QPixmap):
+            return value.width() * value.height() * 4
+        return 1
+
+    def get(self, key):
+        """キャッシュから取得（ヒットした項目は最新扱いにする）"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        self.cache.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value):
+        """キャッシュに登録（予算を超えた分は古い順に破棄）"""
+        old = self.cache.pop(key, None)
+        if old is not None:
+            self._total_cost -= old[1]
+        cost = self._cost_of(value)
+        self.cache[key] = (value, cost)
+        self._total_cost += cost
+        while self._total_cost > self.max_bytes and len(self.cache) > 1:
+            _, (_, evicted_cost) = self.cache.popitem(last=False)
+            self._total_cost -= evicted_cost
+
+    def clear(self):
+        """全エントリを破棄"""
+        self.cache.clear()
+        self._total_cost = 0
+
+
+class ApngStream:
+    """APNGを全フレーム先読みせず、再生に追従して順次デコードする
+
+    直近フレームだけを小さな窓で保持するため、フレーム数の多いAPNGでも
+    常駐メモリはほぼ一定で、最初のフレーム表示までの待ちもO(1)になる。
+    """
+
+    WINDOW = 3
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._img = None
+        self._pil_frames = None
+        self._durations = None
+
+        if _APNGAsmBinder is not None:
+            # 1回のCコールで全フレームを抽出できる。窓によるQImage変換の
+            # 遅延はそのまま効くが、PILフレーム分のメモリは常駐する
+            try:
+                binder = _APNGAsmBinder()
+                pil_frames = binder.disassemble_as_pillow(filepath)
+                if pil_frames:
+                    durations = []
+                    for f in binder.get_frames():
+                        den = f.delay_den or 100
+                        durations.append(int(f.delay_num * 1000 / den) or 100)
+                    self._pil_frames = pil_frames
+                    self._durations = durations
+            except Exception:
+                self._pil_frames = None
+                self._durations = None
+
+        if self._pil_frames is not None:
+            self.n_frames = len(self._pil_frames)
+        else:
+            self._img = Image.open(filepath)
+            self.n_frames = getattr(self._img, "n_frames", 1)
+        self._window = OrderedDict()  # フレーム番号 -> エントリ
+        # PIL経路でデコード時に判明した表示時間を溜める（窓から落ちた
+        # 後もduration()がデコードなしで返せるように）
+        self._duration_cache = {}
+
+    def frame(self, index):
+        """指定フレームのエントリ（image/duration）を返す。未デコードなら生成"""
+        entry = self._window.get(index)
+        if entry is None:
+            if self._pil_frames is not None:
+                frame = self._pil_frames[index].convert("RGBA")
+                duration = 100
+                if self._durations and index < len(self._durations):
+                    duration = self._durations[index]
+            else:
+                img = self._img
+                img.seek(index)
+                frame = img.convert("RGBA")
+                duration = img.info.get("duration", 100)
+                self._duration_cache[index] = duration
+
+            # PIL ImageをQImageに変換。QPixmap化は表示時（GUIスレッド）
+            # まで遅延させる。QImageはバッファを借用するだけなので、
+            # バッファをエントリに持たせて寿命を合わせ、余分なコピーを省く
+            if _np is not None:
+                # numpyビューはPILバッファを直接参照する（コピーなし）
+                data = _np.asarray(frame)
+                qimage = QtGui.QImage(
+                    data.data,
+                    frame.width,
+                    frame.height,
+                    data.strides[0],
+                    QtGui.QImage.Format_RGBA8888,
+                )
+            else:
+                # tobytesの1コピーのみ（QImage側の複製はしない）
+                data = frame.tobytes("raw", "RGBA")
+                qimage = QtGui.QImage(
+                    data, frame.width, frame.height, QtGui.QImage.Format_RGBA8888
+                )
+
+            entry = {
+                "image": qimage,
+                "data": data,
+                "duration": duration,
+            }
+            self._window[index] = entry
+            while len(self._window) > self.WINDOW:
+                self._window.popitem(last=False)
+        return entry
+
+    def duration(self, index):
+        """指定フレームの表示時間(ms)を返す。デコードを強要しない
+
+        再生タイマーはスケール済みフレームがQPixmapCacheに載っていても
+        毎ティック表示時間を引く。ここがframe()経由だと、キャッシュ済み
+        再生でもループのたびに全フレームを再デコードしてしまう。
+        """
+        if self._durations and index < len(self._durations):
+            return self._durations[index]
+        d = self._duration_cache.get(index)
+        if d is None:
+            # 未デコードのフレーム（初回再生時）だけは実デコードで取る
+            d = self.frame(index)["duration"]
+        return d
+
+    def byte_cost(self):
+        """保持メモリの見積もり（ImageCacheの予算管理用）
+
+        C分解経路ではPILフレームが常駐する。それに加えて、窓が
+        いっぱいのときのQImageバッファとQPixmap分を概算する。
+        """
+        if self._pil_frames:
+            w, h = self._pil_frames[0].size
+            resident = self.n_frames
+        elif self._img is not None:
+            w, h = self._img.size
+            resident = 0
+        else:
+            return 1
+        window = min(self.WINDOW, self.n_frames)
+        return (resident + window * 2) * w * h * 4
+
+    def prefetch(self, index):
+        """次フレームをイベントループの空きでデコードしておく"""
+        if self.n_frames > 1:
+            QtCore.QTimer.singleShot(0, lambda: self.frame(index % self.n_frames))
+
+
+# APNGストリームのアプリ共有キャッシュ。プレビューとフルスクリーンが
+# 同じファイルを開いても、ヘッダ解析とフレームデコードの窓を共有できる
+_SHARED_APNG_CACHE = ImageCache(max_bytes=256 * 1024 * 1024)
+
+
+class ImagePreloader(QtCore.QObject):
+    """隣接画像をバックグラウンドで並列デコードするプリローダー
+
+    デコードはThreadPoolExecutorのワーカーで行う。libjpeg/libpngは
+    デコード中にGILを解放するため、複数ファイルがコア数までスケールする。
+    ワーカー側ではQImageまでを作り、QPixmap化は（GUIスレッドでしか
+    行えないため）シグナルを受けた側で行う。
+
+    依頼はexecutorへの直接submit、完了通知はキュー接続のシグナルで
+    届くため、ポーリングループや待ち受け用のQueueは持たない。
+    """
+
+    imageLoaded = QtCore.Signal(str, QtGui.QImage)
+
+    # 滞留依頼の上限。デコードが追い付かない速さでナビゲーションされた
+    # ときに、もう表示されない画像の依頼で詰まらないようにする
+    MAX_IN_FLIGHT = 16
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # ディスクを叩きすぎないようワーカー数は4までに抑える
+        workers = min(4, os.cpu_count() or 1)
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+        self._futures = {}
+
+    def load_image(self, filepath, target_size=None, urgent=False):
+        """デコードを依頼（進行中の重複依頼と上限超過分は捨てる）
+
+        urgent=Trueは今まさに表示を待っている画像用。先読みと違って
+        黙って捨てるわけにはいかないので、滞留上限を適用しない。
+        """
+        if filepath in self._futures:
+            return
+        if not urgent and len(self._futures) >= self.MAX_IN_FLIGHT:
+            return
+        future = self._executor.submit(self._decode, filepath, target_size)
+        self._futures[filepath] = future
+        future.add_done_callback(lambda f, path=filepath: self._on_done(path, f))
+
+    def is_pending(self, filepath):
+        """そのパスのデコード依頼が既に滞留しているか"""
+        return filepath in self._futures
+
+    def _decode(self, filepath, target_size=None):
+        """ワーカースレッドでのデコード（QImageまで）"""
+        if target_size is not None:
+            return _read_preview_image(filepath, target_size)
+        return _read_scaled_image(filepath, target_size)
+
+    def _on_done(self, filepath, future):
+        """デコード完了（ワーカースレッドから呼ばれる）"""
+        self._futures.pop(filepath, None)
+        if future.cancelled():
+            return
+        try:
+            image = future.result()
+        except Exception:
+            image = None
+        if image is None:
+            image = QtGui.QImage()
+        # 失敗もnull画像のまま通知する。黙って落とすと受け側は表示待ちの
+        # まま残り、エラー表示も再選択でのやり直しもできなくなる。
+        # 受け側はGUIスレッドなのでemitはキュー接続で届く
+        self.imageLoaded.emit(filepath, image)
+
+    def cancel_stale(self, keep):
+        """keepに含まれない未着手の依頼を取り消す
+
+        実行中のデコードは中断できない（libjpeg側で走っている）ため
+        完了まで待つが、未着手のfutureはcancelでキューから外れる。
+        ナビゲーションで先読み窓が移動したときに呼ぶ。
+        """
+        for path, future in list(self._futures.items()):
+            if path not in keep and future.cancel():
+                self._futures.pop(path, None)
+
+    def stop(self):
+        """未着手のデコードを破棄して停止"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
 class FullScreenViewer(QtWidgets.QWidget):
     """フルスクリーン画像ビューア"""
 
@@ -242,26 +798,42 @@ class FullScreenViewer(QtWidgets.QWidget):
         # 情報表示ラベル（画像の上に重ねて左下に配置）
         self.info_label = QtWidgets.QLabel(self)
         self.info_label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        # 半透明の背景で文字を立たせる。QGraphicsDropShadowEffectは
+        # 再描画のたびにソフトウェアでぼかし合成が走るため使わない
         self.info_label.setStyleSheet(
-            "color: white; background-color: transparent; padding: 8px; font-size: 14px;"
+            "color: white; background-color: rgba(0, 0, 0, 160);"
+            " border-radius: 6px; padding: 8px; font-size: 14px;"
         )
 
-        # 影効果を追加
-        shadow = QtWidgets.QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(8)
-        shadow.setColor(QtGui.QColor(0, 0, 0, 200))
-        shadow.setOffset(2, 2)
-        self.info_label.setGraphicsEffect(shadow)
-
         self.info_label.raise_()  # 最前面に
+        self._last_info_text = ""
 
         self._current_pixmap = None
 
-        # APNG再生用
-        self._apng_frames = []
+        # スケール済みピクスマップのメモ: (元画像のcacheKey, サイズ, 結果)。
+        # APNG再生中は毎フレーム同じサイズで呼ばれるため効果が大きい
+        self._scaled_cache = (None, None, None)
+
+        # リサイズ中は高速スケールで追従し、落ち着いてから高品質で描き直す
+        self._smooth_timer = QtCore.QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(120)
+        self._smooth_timer.timeout.connect(self.update_scaled_pixmap)
+
+        # APNGストリームは共有キャッシュを参照（静止画は共有QPixmapCache）
+        self.cache = _SHARED_APNG_CACHE
+
+        # APNG再生用。繰り返しタイマーの代わりに単発タイマーを数珠つなぎ
+        # にし、世代番号で停止後の予約分を無効化する
+        self._apng_stream = None
         self._apng_frame_index = 0
-        self._apng_timer = QtCore.QTimer(self)
-        self._apng_timer.timeout.connect(self._next_apng_frame)
+        self._apng_play_id = 0
+
+        # キャッシュ未済の静止画はワーカーでデコードする。表示対象の
+        # パスを控えておき、届いた結果が古ければ捨てる
+        self.preloader = ImagePreloader(self)
+        self.preloader.imageLoaded.connect(self._on_image_loaded)
+        self._pending_path = None
 
         # フルスクリーン表示
         self.showFullScreen()
@@ -269,24 +841,25 @@ class FullScreenViewer(QtWidgets.QWidget):
         # 初期画像を表示
         self.show_current_image()
 
-        self.show_current_image()
+    def _decode_size(self):
+        """縮小デコードの目標サイズ（スクリーンの物理ピクセル数）
+
+        ビューアはズームしないので、スクリーンより大きくデコードしても
+        表示前に捨てられるだけになる。self.size()はshowFullScreen直後は
+        まだ確定していないことがあるため、スクリーン情報から取る。
+        """
+        screen = self.screen() or QtGui.QGuiApplication.primaryScreen()
+        return screen.size() * screen.devicePixelRatio()
 
     def get_all_files_in_current_group(self):
-        """現在のグループ内の全ファイルリストを取得"""
-        left_item = self.parent_window.left_list.currentItem()
-        middle_item = self.parent_window.middle_list.currentItem()
+        """現在のグループ内の全ファイル（フルパス・名前・拡張子）を取得"""
+        left_key = self.parent_window._current_left_key
+        middle_key = self.parent_window._current_middle_key
 
-        if not (left_item and middle_item):
+        if left_key is None or middle_key is None:
             return []
 
-        left_key = left_item.text()
-        middle_key = middle_item.data(QtCore.Qt.UserRole)
-
-        filelist = self.parent_window.group_dict.get(left_key, [])
-        middle_groups = self.parent_window.get_middle_groups(filelist)
-        files = middle_groups.get(middle_key, [])
-
-        return [os.path.join(self.parent_window.image_folder, f) for f in files]
+        return self.parent_window.group_files_for(left_key, middle_key)
 
     def show_current_image(self):
         """現在のインデックスの画像を表示"""
@@ -299,116 +872,228 @@ class FullScreenViewer(QtWidgets.QWidget):
         # インデックスを範囲内に収める
         self.current_index = max(0, min(self.current_index, len(files) - 1))
 
-        filepath = files[self.current_index]
+        filepath, filename, ext = files[self.current_index]
 
         try:
-            ext = os.path.splitext(filepath)[1].lower()
 
             # APNG判定
             if ext == ".png" and self._is_apng(filepath):
+                self._pending_path = None
                 self._show_apng(filepath, files)
             else:
-                # 静止画
-                pixmap = QtGui.QPixmap(filepath)
-                if not pixmap.isNull():
-                    self._apng_timer.stop()
-                    self._apng_frames = []
-                    self._current_pixmap = pixmap
-                    self.update_scaled_pixmap()
-
-                    # 情報表示を更新
-                    filename = os.path.basename(filepath)
-                    info_text = (
-                        f"{self.current_index + 1} / {len(files)}  -  {filename}"
-                    )
-                    self.info_label.setText(info_text)
+                # 情報表示を更新
+                info_text = (
+                    f"{self.current_index + 1} / {len(files)}  -  {filename}"
+                )
+                self._set_info_text(info_text)
+
+                # 静止画（共有キャッシュ済みならデコードを省く）
+                pixmap = QtGui.QPixmap()
+                if QtGui.QPixmapCache.find(filepath, pixmap):
+                    self._pending_path = None
+                    self._apply_static_pixmap(pixmap)
                 else:
-                    self.info_label.setText("画像を読み込めませんでした")
+                    # デコードはワーカーに任せ、待つ間は直前の画像を
+                    # 出したままにする。連打で古くなった結果は
+                    # _on_image_loadedのパス照合で捨てられる。
+                    # スクリーンに収まるサイズまでの縮小デコードで
+                    # 十分（巨大JPEGはIDCTスケーリングで数倍速くなる）
+                    self._pending_path = filepath
+                    # キー押しっぱなしで溜まった古い先読みを先に外し、
+                    # 本命は滞留上限に落とされないようurgentで積む
+                    keep = {filepath}
+                    for idx in (self.current_index - 1, self.current_index + 1):
+                        if 0 <= idx < len(files):
+                            keep.add(files[idx][0])
+                    self.preloader.cancel_stale(keep)
+                    self.preloader.load_image(
+                        filepath, self._decode_size(), urgent=True
+                    )
         except Exception as e:
-            self.info_label.setText(f"エラー: {e}")
+            self._set_info_text(f"エラー: {e}")
+
+        # 表示が済んでから前後の画像を温める（イベントループに戻して
+        # 現在画像の描画を先に通す）
+        QtCore.QTimer.singleShot(0, self._prefetch_neighbors)
+
+    def _prefetch_neighbors(self):
+        """前後の静止画をワーカーでデコードしてキャッシュに載せる"""
+        files = self.get_all_files_in_current_group()
+        if not files:
+            return
+        probe = QtGui.QPixmap()
+        for idx in (self.current_index - 1, self.current_index + 1):
+            if not 0 <= idx < len(files):
+                continue
+            filepath, _, ext = files[idx]
+            # GIF/APNGは静止画キャッシュを使わないので温めない
+            if ext == ".gif":
+                continue
+            if ext == ".png" and _is_apng_file(filepath):
+                continue
+            if QtGui.QPixmapCache.find(filepath, probe):
+                continue
+            self.preloader.load_image(filepath, self._decode_size())
+
+    def _apply_static_pixmap(self, pixmap):
+        """静止画ピクスマップを表示に反映（APNG再生は止める）"""
+        self._apng_play_id += 1
+        self._apng_stream = None
+        self._current_pixmap = pixmap
+        self.update_scaled_pixmap()
+
+    def _on_image_loaded(self, filepath, image):
+        """ワーカーのデコード完了（GUIスレッド）"""
+        pixmap = QtGui.QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            # 先読み分も含めて共有キャッシュへ載せる
+            # （素のパスキー＝スクリーンサイズまでの縮小デコード版）
+            QtGui.QPixmapCache.insert(filepath, pixmap)
+        if filepath != self._pending_path:
+            return
+        self._pending_path = None
+        if pixmap.isNull():
+            self._set_info_text("画像を読み込めませんでした")
+            return
+        self._apply_static_pixmap(pixmap)
+
+    def closeEvent(self, event):
+        """ビューアを閉じる時（未着手のデコードを破棄）"""
+        self.preloader.stop()
+        super().closeEvent(event)
 
     def update_scaled_pixmap(self):
         """画像をスクリーンサイズに合わせて表示"""
-        if self._current_pixmap:
+        if not self._current_pixmap:
+            return
+
+        key = self._current_pixmap.cacheKey()
+        size = self.size()
+        cached_key, cached_size, cached_scaled = self._scaled_cache
+        if key == cached_key and size == cached_size:
+            # 同じ画像・同じサイズならスケール済みを使い回す
+            self.image_label.setPixmap(cached_scaled)
+            return
+
+        if self._smooth_timer.isActive():
+            # リサイズ操作中は荒くても速いニアレストネイバーで描く
+            mode = QtCore.Qt.FastTransformation
+        else:
+            mode = QtCore.Qt.SmoothTransformation
+
+        # 直前分のメモを外れても、共有キャッシュにスケール済みが残って
+        # いれば再スケールせずに済む（行き来するナビゲーションで効く）
+        cache_key = f"scaled:{key}@{size.width()}x{size.height()}"
+        scaled = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(cache_key, scaled):
             scaled = self._current_pixmap.scaled(
-                self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+                size, QtCore.Qt.KeepAspectRatio, mode
             )
-            self.image_label.setPixmap(scaled)
+            if mode == QtCore.Qt.SmoothTransformation:
+                QtGui.QPixmapCache.insert(cache_key, scaled)
+        if mode == QtCore.Qt.SmoothTransformation:
+            self._scaled_cache = (key, size, scaled)
+        self.image_label.setPixmap(scaled)
+
+    def _set_info_text(self, text):
+        """情報ラベルを更新（同じ文字列なら再レイアウトを省く）"""
+        if text != self._last_info_text:
+            self.info_label.setText(text)
+            self._last_info_text = text
 
     def _is_apng(self, filepath):
         """PNGファイルがAPNGかチェック"""
-        try:
-            with Image.open(filepath) as img:
-                return getattr(img, "is_animated", False)
-        except:
-            return False
+        return _is_apng_file(filepath)
 
     def _show_apng(self, filepath, files):
         """APNGを読み込んで再生"""
-        self._apng_timer.stop()
-        self._apng_frames = []
+        self._apng_play_id += 1
+        self._apng_stream = None
         self._apng_frame_index = 0
+        # 全フレームがキャッシュ済みだと_show_apng_frameはこれを更新
+        # しないため、前の静止画が残っているとリサイズ時にそれが
+        # 再スケールされて表示されてしまう
+        self._current_pixmap = None
 
         try:
-            img = Image.open(filepath)
-
-            # 全フレームを読み込み
-            for frame_index in range(getattr(img, "n_frames", 1)):
-                img.seek(frame_index)
-                frame = img.convert("RGBA")
-
-                # PIL ImageをQPixmapに変換
-                data = frame.tobytes("raw", "RGBA")
-                qimage = QtGui.QImage(
-                    data, frame.width, frame.height, QtGui.QImage.Format_RGBA8888
-                )
-                pixmap = QtGui.QPixmap.fromImage(qimage)
-
-                # フレーム時間を取得（ミリ秒）
-                duration = img.info.get("duration", 100)
-
-                self._apng_frames.append({"pixmap": pixmap, "duration": duration})
-
-            if self._apng_frames:
-                self._show_apng_frame(0)
-
-                # 情報表示を更新
-                filename = os.path.basename(filepath)
-                info_text = (
-                    f"{self.current_index + 1} / {len(files)}  -  {filename} (APNG)"
-                )
-                self.info_label.setText(info_text)
+            # ストリームをキャッシュしておけば再訪時にヘッダ解析も省ける
+            stream = self.cache.get(filepath)
+            if stream is None:
+                stream = ApngStream(filepath)
+                self.cache.put(filepath, stream)
+            self._apng_stream = stream
+
+            self._show_apng_frame(0)
+
+            # 情報表示を更新
+            filename = os.path.basename(filepath)
+            info_text = (
+                f"{self.current_index + 1} / {len(files)}  -  {filename} (APNG)"
+            )
+            self._set_info_text(info_text)
 
-                if len(self._apng_frames) > 1:
-                    self._apng_timer.start(self._apng_frames[0]["duration"])
-            else:
-                self.info_label.setText("APNGを読み込めませんでした")
+            if stream.n_frames > 1:
+                self._schedule_next_apng_frame(stream.duration(0))
 
         except Exception as e:
-            self.info_label.setText(f"APNGエラー: {e}")
-            self._apng_frames = []
+            self._set_info_text(f"APNGエラー: {e}")
+            self._apng_stream = None
 
     def _show_apng_frame(self, index):
         """APNGの指定フレームを表示"""
-        if 0 <= index < len(self._apng_frames):
-            frame_data = self._apng_frames[index]
-            self._current_pixmap = frame_data["pixmap"]
-            self.update_scaled_pixmap()
-            self._apng_frame_index = index
+        stream = self._apng_stream
+        if stream is None or not (0 <= index < stream.n_frames):
+            return
 
-    def _next_apng_frame(self):
+        # スケール済みフレームを(ファイル, フレーム, サイズ)で共有キャッシュに
+        # 持つ。ループ2周目以降はデコードもSmoothスケールも走らない
+        size = self.size()
+        key = f"apng:{stream.filepath}#{index}@{size.width()}x{size.height()}"
+        scaled = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, scaled):
+            frame_data = stream.frame(index)
+            pixmap = frame_data.get("pixmap")
+            if pixmap is None:
+                # 初回表示時にGUIスレッドでQPixmap化し、以降は使い回す
+                pixmap = QtGui.QPixmap.fromImage(frame_data["image"])
+                frame_data["pixmap"] = pixmap
+            self._current_pixmap = pixmap
+            scaled = pixmap.scaled(
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+            QtGui.QPixmapCache.insert(key, scaled)
+            # 表示中に次フレームを先にデコードしておく
+            stream.prefetch(index + 1)
+        self.image_label.setPixmap(scaled)
+        self._apng_frame_index = index
+
+    def _schedule_next_apng_frame(self, duration):
+        """次フレームの表示を単発タイマーで予約する
+
+        フレームごとにsetIntervalでタイマーを張り直すとOSタイマーの
+        再設定が毎回走る。精度の粗いCoarseTimerの単発予約で十分。
+        """
+        play_id = self._apng_play_id
+        QtCore.QTimer.singleShot(
+            duration, QtCore.Qt.CoarseTimer, lambda: self._next_apng_frame(play_id)
+        )
+
+    def _next_apng_frame(self, play_id):
         """次のAPNGフレームを表示"""
-        if not self._apng_frames:
-            self._apng_timer.stop()
+        if play_id != self._apng_play_id:
+            return  # 停止・切り替え後に届いた古い予約
+        stream = self._apng_stream
+        if stream is None or stream.n_frames <= 1:
             return
 
-        self._apng_frame_index = (self._apng_frame_index + 1) % len(self._apng_frames)
+        self._apng_frame_index = (self._apng_frame_index + 1) % stream.n_frames
         self._show_apng_frame(self._apng_frame_index)
 
-        # 次のフレームの時間でタイマーを再設定
-        if self._apng_frames:
-            duration = self._apng_frames[self._apng_frame_index]["duration"]
-            self._apng_timer.setInterval(duration)
+        # 次のフレームを予約（durationはデコードを伴わずに引けるので
+        # キャッシュ済み再生のティックでframe()を呼ばない）
+        self._schedule_next_apng_frame(
+            stream.duration(self._apng_frame_index)
+        )
 
     def resizeEvent(self, event):
         """ウィンドウサイズ変更時"""
@@ -421,7 +1106,8 @@ class FullScreenViewer(QtWidgets.QWidget):
         self.info_label.setGeometry(
             10, self.height() - info_height - 10, info_width, info_height
         )
-        # 画像を再スケール
+        # 画像を再スケール（高品質版はタイマー経由で後追い）
+        self._smooth_timer.start()
         self.update_scaled_pixmap()
 
     def keyPressEvent(self, event):
@@ -514,8 +1200,8 @@ class FullScreenViewer(QtWidgets.QWidget):
         current_row = middle_list.currentRow()
 
         if current_row < middle_list.count() - 1:
-            # 次のグループがある
-            middle_list.setCurrentRow(current_row + 1)
+            # 次のグループがある（連鎖を1回にまとめて適用）
+            self.parent_window.select_group_rows(middle_row=current_row + 1)
             # フルスクリーン時は最初のファイルを表示
             self.current_index = 0
             self.show_current_image()
@@ -531,8 +1217,8 @@ class FullScreenViewer(QtWidgets.QWidget):
         current_row = middle_list.currentRow()
 
         if current_row > 0:
-            # 前のグループがある
-            middle_list.setCurrentRow(current_row - 1)
+            # 前のグループがある（連鎖を1回にまとめて適用）
+            self.parent_window.select_group_rows(middle_row=current_row - 1)
             # フルスクリーン時は最初のファイルを表示
             self.current_index = 0
             self.show_current_image()
@@ -548,11 +1234,10 @@ class FullScreenViewer(QtWidgets.QWidget):
         current_row = left_list.currentRow()
 
         if current_row < left_list.count() - 1:
-            # 次のグループがある
-            left_list.setCurrentRow(current_row + 1)
-            # 中リストの最初を選択
-            if self.parent_window.middle_list.count() > 0:
-                self.parent_window.middle_list.setCurrentRow(0)
+            # 次の左グループ＋中リスト先頭をまとめて選択（連鎖は1回）
+            self.parent_window.select_group_rows(
+                left_row=current_row + 1, middle_row=0
+            )
             # フルスクリーン時は最初のファイルを表示
             self.current_index = 0
             self.show_current_image()
@@ -566,12 +1251,10 @@ class FullScreenViewer(QtWidgets.QWidget):
         current_row = left_list.currentRow()
 
         if current_row > 0:
-            # 前のグループがある
-            left_list.setCurrentRow(current_row - 1)
-            # 中リストの最後を選択（前に戻るので最後から）
-            middle_count = self.parent_window.middle_list.count()
-            if middle_count > 0:
-                self.parent_window.middle_list.setCurrentRow(middle_count - 1)
+            # 前の左グループ＋中リスト末尾をまとめて選択（連鎖は1回）
+            self.parent_window.select_group_rows(
+                left_row=current_row - 1, middle_row=-1
+            )
             # フルスクリーン時は最初のファイルを表示
             self.current_index = 0
             self.show_current_image()
@@ -604,11 +1287,154 @@ class ImagePreviewWidget(QtWidgets.QLabel):
         self._current_movie = None
         self._current_filepath = None
 
-        # APNG再生用
-        self._apng_frames = []
+        # 隣接画像の先読み（親ウィンドウはsetup_ui側で設定される）
+        self.parent_window = None
+        self.preload_backward = 3
+        self.preload_forward = 7
+        self._size_cache = {}  # フルパス -> バイトサイズ（statの繰り返しを回避）
+
+        # 適応型の先読み窓。連続ナビゲーション中は広げ、ジャンプしたら
+        # 狭める（Linuxのreadaheadと同じ発想）
+        self._prefetch_window = 3
+        self._last_row = -1
+        # APNGストリームは共有キャッシュを参照（静止画は共有QPixmapCache）
+        self.cache = _SHARED_APNG_CACHE
+        self.preloader = ImagePreloader(self)
+        self.preloader.imageLoaded.connect(self._on_image_preloaded)
+
+        # APNG再生用。繰り返しタイマーの代わりに単発タイマーを数珠つなぎ
+        # にし、世代番号で停止後の予約分を無効化する
+        self._apng_stream = None
         self._apng_frame_index = 0
-        self._apng_timer = QtCore.QTimer(self)
-        self._apng_timer.timeout.connect(self._next_apng_frame)
+        self._apng_play_id = 0
+
+        # リサイズ中は低品質スケールで追従し、落ち着いてから高品質で
+        # 描き直す（フルスクリーンビューアと同じ手口）
+        self._smooth_timer = QtCore.QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(120)
+        self._smooth_timer.timeout.connect(self._update_scaled_pixmap)
+
+    def _get_adjacent_files(self):
+        """現在の右リスト選択の前後にあるファイルのフルパス一覧を取得
+
+        直前行との差分から先読み窓の広さを更新する副作用があるため、
+        ナビゲーション1回につき1回だけ呼び、結果を使い回すこと
+        """
+        pw = self.parent_window
+        if pw is None:
+            return []
+
+        left_key = pw._current_left_key
+        middle_key = pw._current_middle_key
+        if left_key is None or middle_key is None:
+            return []
+
+        files = pw.middle_groups_for(left_key).get(middle_key, [])
+        current_row = pw.right_list.currentRow()
+
+        # 連続した行移動なら窓を倍に広げて進行方向に厚く読み、
+        # 飛び移動なら窓を半分に縮めて無駄な先読みを減らす
+        delta = current_row - self._last_row
+        self._last_row = current_row
+        if delta == 1 or delta == -1:
+            self._prefetch_window = min(self._prefetch_window * 2, 10)
+            forward = self._prefetch_window if delta > 0 else 1
+            backward = self._prefetch_window if delta < 0 else 1
+        else:
+            self._prefetch_window = max(self._prefetch_window // 2, 1)
+            forward = self.preload_forward
+            backward = self.preload_backward
+
+        # ループ内で参照するものは先に取り出しておく（os.path.joinの
+        # 呼び出しも連結済みプレフィックスで置き換える）。前後の窓は
+        # 境界をクランプした1本のレンジにまとめ、現在行だけ除く
+        prefix = pw._folder_prefix
+        lo = max(0, current_row - backward)
+        hi = min(len(files), current_row + forward + 1)
+        return [prefix + files[i] for i in range(lo, hi) if i != current_row]
+
+    def _decode_size(self):
+        """縮小デコードの目標サイズ（Retina等では物理ピクセルで数える）"""
+        return self.size() * self.devicePixelRatioF()
+
+    def _preview_key(self, filepath):
+        """縮小デコード版のキャッシュキー（フル解像度版と区別する）"""
+        size = self._decode_size()
+        return f"{filepath}@preview{size.width()}x{size.height()}"
+
+    def _file_size(self, path):
+        """ファイルサイズを取得（スキャン時のstat結果を優先的に使う）"""
+        size = self._size_cache.get(path)
+        if size is None:
+            pw = self.parent_window
+            if pw is not None:
+                size = pw._size_cache.get(path.rsplit("/", 1)[-1])
+            if size is None:
+                try:
+                    size = os.path.getsize(path)
+                except OSError:
+                    size = 0
+            self._size_cache[path] = size
+        return size
+
+    def _start_preloading(self, adjacent):
+        """前後のファイルをバックグラウンドでデコードしておく"""
+        target_size = self._decode_size()
+        probe = QtGui.QPixmap()  # 存在確認用に1つだけ使い回す
+        pending = []
+        for path in adjacent:
+            # GIFはQMovie再生でキャッシュを使わないため先読みしない
+            if path.lower().endswith(".gif"):
+                continue
+            if QtGui.QPixmapCache.find(self._preview_key(path), probe):
+                continue
+            # APNGは表示時にストリーム再生へ回り、先読みした静止画
+            # （先頭フレーム）は使われないためワーカーに流さない
+            if path.lower().endswith(".png") and _is_apng_file(path):
+                continue
+            # 依頼済みならfadviseもソートも繰り返さない（矢印キー連打で
+            # 同じ近傍が毎回積み直されるのを防ぐ）
+            if self.preloader.is_pending(path):
+                continue
+            pending.append(path)
+
+        # 小さいファイルから依頼する。近傍の軽いJPEGが巨大ファイルの
+        # 後ろに並ばず、短時間でキャッシュに載る枚数が最大になる
+        pending.sort(key=self._file_size)
+
+        # デコードを依頼する前にOSへ先読みヒントを出しておくと、
+        # ワーカーが読みに行く頃にはページキャッシュに載っている
+        _advise_willneed(pending)
+        for path in pending:
+            self.preloader.load_image(path, target_size)
+
+    def _on_image_preloaded(self, filepath, image):
+        """先読み完了（GUIスレッド）。QPixmap化してキャッシュへ"""
+        if image.isNull():
+            # デコード失敗。表示待ちだった画像ならエラーを出し、
+            # 同一パスガードに掛からないよう現在パスを外して
+            # 再選択でやり直せるようにする
+            if filepath == self._current_filepath:
+                self.setText("画像を読み込めませんでした")
+                self._current_filepath = None
+            return
+        pixmap = QtGui.QPixmap.fromImage(image)
+        QtGui.QPixmapCache.insert(self._preview_key(filepath), pixmap)
+
+        # 表示待ちだった画像ならそのまま反映する
+        if (
+            filepath == self._current_filepath
+            and self._current_pixmap is None
+            and self._apng_stream is None
+            and self._current_movie is None
+        ):
+            self._current_pixmap = pixmap
+            self._update_scaled_pixmap()
+
+    def cleanup(self):
+        """バックグラウンド処理を停止"""
+        self.preloader.stop()
 
     def set_image(self, filepath):
         """画像/動画/APNG を読み込んで表示"""
@@ -616,9 +1442,20 @@ class ImagePreviewWidget(QtWidgets.QLabel):
             self.clear_image()
             return
 
+        # 同じ行の再クリックや選択の揺り戻しでは再デコードしない
+        if filepath == self._current_filepath:
+            return
+
         self._current_filepath = filepath
         ext = os.path.splitext(filepath)[1].lower()
 
+        # 表示位置が動いたので、新しい先読み窓から外れた未着手の依頼を
+        # 取り消す。これで今見たい画像のデコードが古い先読みに並ばない。
+        # 窓はここで1回だけ計算し、後段の先読み依頼にも同じものを渡す
+        # （二度計算すると窓の広さを調整する状態が二重に進んでしまう）
+        adjacent = self._get_adjacent_files()
+        self.preloader.cancel_stale(set(adjacent) | {filepath})
+
         # GIFアニメーション
         if ext == ".gif":
             self._show_animated_gif(filepath)
@@ -632,20 +1469,30 @@ class ImagePreviewWidget(QtWidgets.QLabel):
             # 静止画
             self._show_static_image(filepath)
 
+        # 表示が済んだら隣接ファイルを先読みしておく
+        self._start_preloading(adjacent)
+
     def _show_static_image(self, filepath):
         """静止画を表示"""
         self._clear_movie()
-        try:
-            pixmap = QtGui.QPixmap(filepath)
-            if pixmap.isNull():
-                self.setText("画像を読み込めませんでした")
-                self._current_pixmap = None
-            else:
-                self._current_pixmap = pixmap
-                self._update_scaled_pixmap()
-        except Exception as e:
-            self.setText(f"エラー: {e}")
-            self._current_pixmap = None
+        # APNGからの切り替えでも再生予約が残らないよう止めておく
+        self._apng_play_id += 1
+        self._apng_stream = None
+
+        # 先読み済みならデコードせず共有キャッシュから取り出す。
+        # プレビューは表示サイズまでの縮小デコードで足りる
+        key = self._preview_key(filepath)
+        pixmap = QtGui.QPixmap()
+        if QtGui.QPixmapCache.find(key, pixmap):
+            self._current_pixmap = pixmap
+            self._update_scaled_pixmap()
+            return
+
+        # 未キャッシュでもGUIスレッドではデコードしない。ワーカー完了時に
+        # _on_image_preloadedが、まだこのパスが表示対象なら反映する。
+        # 待つ間は直前の表示を出したままにする
+        self._current_pixmap = None
+        self.preloader.load_image(filepath, self._decode_size(), urgent=True)
 
     def _show_animated_gif(self, filepath):
         """GIFアニメーションを表示"""
@@ -673,96 +1520,136 @@ class ImagePreviewWidget(QtWidgets.QLabel):
 
     def _is_apng(self, filepath):
         """PNGファイルがAPNGかチェック"""
-        try:
-            with Image.open(filepath) as img:
-                return getattr(img, "is_animated", False)
-        except:
-            return False
+        return _is_apng_file(filepath)
 
     def _show_apng(self, filepath):
         """APNGを読み込んで再生"""
         self._clear_movie()
         self._current_pixmap = None
-        self._apng_timer.stop()
-        self._apng_frames = []
+        self._apng_play_id += 1
+        self._apng_stream = None
         self._apng_frame_index = 0
 
         try:
-            img = Image.open(filepath)
+            # ストリームをキャッシュしておけば再訪時にヘッダ解析も省ける
+            stream = self.cache.get(filepath)
+            if stream is None:
+                stream = ApngStream(filepath)
+                self.cache.put(filepath, stream)
+            self._apng_stream = stream
 
-            # 全フレームを読み込み
-            for frame_index in range(getattr(img, "n_frames", 1)):
-                img.seek(frame_index)
-                frame = img.convert("RGBA")
-
-                # PIL ImageをQPixmapに変換
-                data = frame.tobytes("raw", "RGBA")
-                qimage = QtGui.QImage(
-                    data, frame.width, frame.height, QtGui.QImage.Format_RGBA8888
-                )
-                pixmap = QtGui.QPixmap.fromImage(qimage)
-
-                # フレーム時間を取得（ミリ秒）
-                duration = img.info.get("duration", 100)
-
-                self._apng_frames.append({"pixmap": pixmap, "duration": duration})
-
-            if self._apng_frames:
-                self._show_apng_frame(0)
-                if len(self._apng_frames) > 1:
-                    self._apng_timer.start(self._apng_frames[0]["duration"])
-            else:
-                self.setText("APNGを読み込めませんでした")
+            self._show_apng_frame(0)
+            if stream.n_frames > 1:
+                self._schedule_next_apng_frame(stream.duration(0))
 
         except Exception as e:
             self.setText(f"APNGエラー: {e}")
-            self._apng_frames = []
+            self._apng_stream = None
 
     def _show_apng_frame(self, index):
         """APNGの指定フレームを表示"""
-        if 0 <= index < len(self._apng_frames):
-            frame_data = self._apng_frames[index]
-            self._current_pixmap = frame_data["pixmap"]
-            self._update_scaled_pixmap()
-            self._apng_frame_index = index
+        stream = self._apng_stream
+        if stream is None or not (0 <= index < stream.n_frames):
+            return
 
-    def _next_apng_frame(self):
+        # スケール済みフレームを(ファイル, フレーム, サイズ)で共有キャッシュに
+        # 持つ。ループ2周目以降はデコードもSmoothスケールも走らない
+        size = self.size()
+        key = f"apng:{stream.filepath}#{index}@{size.width()}x{size.height()}"
+        scaled = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(key, scaled):
+            frame_data = stream.frame(index)
+            pixmap = frame_data.get("pixmap")
+            if pixmap is None:
+                # 初回表示時にGUIスレッドでQPixmap化し、以降は使い回す
+                pixmap = QtGui.QPixmap.fromImage(frame_data["image"])
+                frame_data["pixmap"] = pixmap
+            self._current_pixmap = pixmap
+            scaled = pixmap.scaled(
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+            )
+            QtGui.QPixmapCache.insert(key, scaled)
+            # 表示中に次フレームを先にデコードしておく
+            stream.prefetch(index + 1)
+        self.setPixmap(scaled)
+        self._apng_frame_index = index
+
+    def _schedule_next_apng_frame(self, duration):
+        """次フレームの表示を単発タイマーで予約する
+
+        フレームごとにsetIntervalでタイマーを張り直すとOSタイマーの
+        再設定が毎回走る。精度の粗いCoarseTimerの単発予約で十分。
+        """
+        play_id = self._apng_play_id
+        QtCore.QTimer.singleShot(
+            duration, QtCore.Qt.CoarseTimer, lambda: self._next_apng_frame(play_id)
+        )
+
+    def _next_apng_frame(self, play_id):
         """次のAPNGフレームを表示"""
-        if not self._apng_frames:
-            self._apng_timer.stop()
+        if play_id != self._apng_play_id:
+            return  # 停止・切り替え後に届いた古い予約
+        stream = self._apng_stream
+        if stream is None or stream.n_frames <= 1:
             return
 
-        self._apng_frame_index = (self._apng_frame_index + 1) % len(self._apng_frames)
+        self._apng_frame_index = (self._apng_frame_index + 1) % stream.n_frames
         self._show_apng_frame(self._apng_frame_index)
 
-        # 次のフレームの時間でタイマーを再設定
-        if self._apng_frames:
-            duration = self._apng_frames[self._apng_frame_index]["duration"]
-            self._apng_timer.setInterval(duration)
+        # 次のフレームを予約（durationはデコードを伴わずに引けるので
+        # キャッシュ済み再生のティックでframe()を呼ばない）
+        self._schedule_next_apng_frame(
+            stream.duration(self._apng_frame_index)
+        )
 
     def clear_image(self):
         """画像をクリア"""
         self.setText("画像を選択してください\n\nダブルクリックでフルスクリーン表示")
         self._clear_movie()
-        self._apng_timer.stop()
-        self._apng_frames = []
+        self._apng_play_id += 1
+        self._apng_stream = None
         self._current_pixmap = None
         self._current_filepath = None
 
     def _update_scaled_pixmap(self):
         """ウィンドウサイズに合わせて画像を拡大縮小"""
-        if self._current_pixmap:
+        if not self._current_pixmap:
+            return
+
+        # 高DPI環境では論理サイズでなく物理ピクセルでスケールする
+        dpr = self.devicePixelRatioF()
+        size = self._decode_size()
+
+        # リサイズ追従中は粗く速く。キャッシュには高品質の結果だけ載せる
+        if self._smooth_timer.isActive():
+            fast = self._current_pixmap.scaled(
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.FastTransformation
+            )
+            fast.setDevicePixelRatio(dpr)
+            self.setPixmap(fast)
+            return
+
+        # スケール済みを共有キャッシュに持ち、再訪時のバイリニアパスを省く
+        cache_key = (
+            f"scaled:{self._current_pixmap.cacheKey()}"
+            f"@{size.width()}x{size.height()}"
+        )
+        scaled = QtGui.QPixmap()
+        if not QtGui.QPixmapCache.find(cache_key, scaled):
             scaled = self._current_pixmap.scaled(
-                self.size(), QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
+                size, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation
             )
-            self.setPixmap(scaled)
+            scaled.setDevicePixelRatio(dpr)
+            QtGui.QPixmapCache.insert(cache_key, scaled)
+        self.setPixmap(scaled)
 
     def resizeEvent(self, event):
         """ウィンドウサイズ変更時に画像を再スケール"""
         super().resizeEvent(event)
         if self._current_movie and self._current_movie.isValid():
             self._current_movie.setScaledSize(self.size())
-        else:
+        elif self._current_pixmap:
+            self._smooth_timer.start()
             self._update_scaled_pixmap()
 
     def mouseDoubleClickEvent(self, event):
@@ -771,7 +1658,95 @@ class ImagePreviewWidget(QtWidgets.QLabel):
             self.doubleClicked.emit()
 
 
+class GroupListModel(QtCore.QAbstractListModel):
+    """表示文字列と元キーだけを持つ軽量リストモデル
+
+    QListWidgetは行ごとにQListWidgetItemを確保するため、数千グループの
+    再構築ではアイテム割り当てが支配的になる。Pythonのリストを直接
+    参照するモデルなら、再構築は列の差し替え1回で済む。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts = []
+        self._keys = []
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._texts)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        row = index.row()
+        if not 0 <= row < len(self._texts):
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self._texts[row]
+        if role == QtCore.Qt.UserRole:
+            return self._keys[row]
+        return None
+
+    def set_rows(self, texts, keys=None):
+        """表示列と（あれば）キー列を丸ごと差し替える"""
+        self.beginResetModel()
+        self._texts = list(texts)
+        self._keys = self._texts if keys is None else list(keys)
+        self.endResetModel()
+
+    def text_at(self, row):
+        return self._texts[row] if 0 <= row < len(self._texts) else None
+
+    def key_at(self, row):
+        return self._keys[row] if 0 <= row < len(self._keys) else None
+
+
+class GroupListView(QtWidgets.QListView):
+    """GroupListModel専用のリストビュー
+
+    呼び出し側が行番号ベースで書かれているため、QListWidget互換の
+    行指向APIを薄く被せてある。選択変更もQListWidgetと同名の
+    itemSelectionChangedとして再発行する。
+    """
+
+    itemSelectionChanged = QtCore.Signal()
+
+    def __init__(self):
+        super().__init__()
+        self._list_model = GroupListModel(self)
+        self.setModel(self._list_model)
+        # 行高は均一なので行ごとのsizeHint計算を省かせる
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setBatchSize(100)
+        self.selectionModel().selectionChanged.connect(self.itemSelectionChanged)
+
+    def count(self):
+        return self._list_model.rowCount()
+
+    def currentRow(self):
+        return self.currentIndex().row()
+
+    def setCurrentRow(self, row):
+        self.setCurrentIndex(self._list_model.index(row, 0))
+
+    def set_rows(self, texts, keys=None):
+        self._list_model.set_rows(texts, keys)
+
+    def clear(self):
+        self._list_model.set_rows(())
+
+    def current_text(self):
+        return self._list_model.text_at(self.currentIndex().row())
+
+    def current_key(self):
+        return self._list_model.key_at(self.currentIndex().row())
+
+
 class ImageGroupNavigator(QtWidgets.QMainWindow):
+    # スキャンスレッド → GUIスレッドへの結果通知
+    # (folder, group_dict, display_name_cache, error)
+    scan_finished = QtCore.Signal(int, str, object, object, object, object, str)
+    # Finder表示の存在確認（ワーカースレッド → GUIスレッド）
+    reveal_checked = QtCore.Signal(str, bool, object)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("画像グループナビゲーター")
@@ -783,20 +1758,76 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         )
         config_dir.mkdir(parents=True, exist_ok=True)  # フォルダがなければ作成
         self.config_path = config_dir / "image_group_navigator_config.json"
+        # 最後に読み書きした設定内容とそのmtime。内容が同じなら書き込みを
+        # 省き、ファイルが未変更なら再パースも省く
+        self._last_saved_config = None
+        self._config_mtime_ns = None
+
+        # ファイル一覧キャッシュ（低速な外部ボリュームの再スキャン回避用）
+        self._filelist_cache_path = (
+            Path.home() / ".cache" / "image_group_navigator" / "filelist_cache.txt"
+        )
 
         # 初期化
         self.image_folder = ""
+        self._folder_prefix = ""
         self.group_dict = {}
         self.group_keys = []
+        # 走っているスキャンの世代。古いスキャンの結果は捨てる
+        self._scan_generation = 0
+        self._middle_groups_cache = {}
+        self._group_files_cache = {}
+        # 中リストの表示文字列（日付整形済み）。左キーごとにキャッシュ
+        self._middle_texts_cache = {}
+
+        # 現在選択中の左・中キーのミラー。キー操作のホットパスで
+        # Qt側のcurrentIndex→モデル参照を繰り返さず、属性参照だけで
+        # 済むよう、選択の実処理(_do_left_select/_do_middle_select)で更新する
+        self._current_left_key = None
+        self._current_middle_key = None
+        self._display_name_cache = {}
+        self._ctime_cache = {}
+        # スキャン時のstatから取ったファイルサイズ（名前 -> バイト数）
+        self._size_cache = {}
+        self._sorted_groups = set()
         self.sort_order = "name"  # "name" または "date"
         self.fullscreen_viewer = None
 
         # ショートカットマネージャー
         self.shortcut_manager = ShortcutManager()
 
+        # 矢印キー押しっぱなし時に選択変更ごとの再構築が走らないよう、
+        # 左・中リストの選択処理は短いデバウンスで確定後にまとめて行う
+        self._left_select_timer = QtCore.QTimer(self)
+        self._left_select_timer.setSingleShot(True)
+        self._left_select_timer.setInterval(30)
+        self._left_select_timer.timeout.connect(self._do_left_select)
+
+        self._middle_select_timer = QtCore.QTimer(self)
+        self._middle_select_timer.setSingleShot(True)
+        self._middle_select_timer.setInterval(30)
+        self._middle_select_timer.timeout.connect(self._do_middle_select)
+
+        # 右リストはデコードが走るぶん少し長めに待つ。矢印キー押しっぱ
+        # なしの通過行をデコードせず、止まった行だけ表示する
+        self._right_select_timer = QtCore.QTimer(self)
+        self._right_select_timer.setSingleShot(True)
+        self._right_select_timer.setInterval(80)
+        self._right_select_timer.timeout.connect(self._do_right_select)
+
+        # 設定保存も連続した変更を1回の書き込みにまとめる
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._do_save_settings)
+
         # UI構築
         self.setup_ui()
 
+        # スキャン結果の受け口（ワーカースレッドからのemitはキュー経由で届く）
+        self.scan_finished.connect(self._on_scan_finished)
+        self.reveal_checked.connect(self._do_reveal)
+
         # 設定を読み込み
         self.load_settings()
 
@@ -821,9 +1852,9 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         browse_btn.clicked.connect(self.browse_folder)
         folder_layout.addWidget(browse_btn)
 
-        scan_btn = QtWidgets.QPushButton("スキャン")
-        scan_btn.clicked.connect(self.scan_folder)
-        folder_layout.addWidget(scan_btn)
+        self.scan_btn = QtWidgets.QPushButton("スキャン")
+        self.scan_btn.clicked.connect(self.scan_folder)
+        folder_layout.addWidget(self.scan_btn)
 
         settings_btn = QtWidgets.QPushButton("ショートカット設定...")
         settings_btn.clicked.connect(self.open_shortcut_settings)
@@ -853,14 +1884,18 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         content_layout = QtWidgets.QHBoxLayout()
 
         # 左リスト（グループ先頭）
-        left_widget = self.create_list_widget("グループ先頭", with_buttons=True)
+        left_widget = self.create_list_widget(
+            "グループ先頭", with_buttons=True, model_based=True
+        )
         self.left_list = left_widget["list"]
         self.left_up_btn = left_widget["up_btn"]
         self.left_down_btn = left_widget["down_btn"]
         content_layout.addWidget(left_widget["container"], 1)
 
         # 中リスト（グループ中間）
-        middle_widget = self.create_list_widget("グループ中間", with_buttons=True)
+        middle_widget = self.create_list_widget(
+            "グループ中間", with_buttons=True, model_based=True
+        )
         self.middle_list = middle_widget["list"]
         self.middle_up_btn = middle_widget["up_btn"]
         self.middle_down_btn = middle_widget["down_btn"]
@@ -869,6 +1904,11 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         # 右リスト（ファイル名）
         right_widget = self.create_list_widget("ファイル名", with_buttons=True)
         self.right_list = right_widget["list"]
+        # ファイル名リストは数千件になり得るので、行高を均一と宣言して
+        # 行ごとのsizeHint計算を省き、レイアウトもバッチ単位で行わせる
+        self.right_list.setUniformItemSizes(True)
+        self.right_list.setLayoutMode(QtWidgets.QListView.Batched)
+        self.right_list.setBatchSize(100)
         self.right_up_btn = right_widget["up_btn"]
         self.right_down_btn = right_widget["down_btn"]
         content_layout.addWidget(right_widget["container"], 1)
@@ -878,6 +1918,7 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         preview_layout = QtWidgets.QVBoxLayout(preview_container)
         preview_layout.addWidget(QtWidgets.QLabel("プレビュー"))
         self.preview_widget = ImagePreviewWidget()
+        self.preview_widget.parent_window = self
         self.preview_widget.doubleClicked.connect(self.show_fullscreen)
         preview_layout.addWidget(self.preview_widget, 1)
         content_layout.addWidget(preview_container, 1)
@@ -890,7 +1931,7 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         # シグナル接続
         self.connect_signals()
 
-    def create_list_widget(self, title, with_buttons=False):
+    def create_list_widget(self, title, with_buttons=False, model_based=False):
         """リストウィジェット（ボタン付き）を作成"""
         container = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(container)
@@ -898,7 +1939,7 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
         layout.addWidget(QtWidgets.QLabel(title))
 
-        list_widget = QtWidgets.QListWidget()
+        list_widget = GroupListView() if model_based else QtWidgets.QListWidget()
         list_widget.setFont(QtGui.QFont("Helvetica", 12))
         layout.addWidget(list_widget, 1)
 
@@ -924,10 +1965,10 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         self.right_list.itemSelectionChanged.connect(self.on_right_select)
 
         # ダブルクリック
-        self.left_list.itemDoubleClicked.connect(
+        self.left_list.doubleClicked.connect(
             lambda: self.open_current_image(self.left_list)
         )
-        self.middle_list.itemDoubleClicked.connect(
+        self.middle_list.doubleClicked.connect(
             lambda: self.open_current_image(self.middle_list)
         )
         self.right_list.itemDoubleClicked.connect(
@@ -935,10 +1976,10 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         )
 
         # Enterキー
-        self.left_list.itemActivated.connect(
+        self.left_list.activated.connect(
             lambda: self.open_current_image(self.left_list)
         )
-        self.middle_list.itemActivated.connect(
+        self.middle_list.activated.connect(
             lambda: self.open_current_image(self.middle_list)
         )
         self.right_list.itemActivated.connect(
@@ -970,7 +2011,7 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         focused = QtWidgets.QApplication.focusWidget()
 
         # Enterキー（リストにフォーカスがある場合）
-        if isinstance(focused, QtWidgets.QListWidget):
+        if isinstance(focused, QtWidgets.QListView):
             if (
                 event.key() == QtCore.Qt.Key_Return
                 or event.key() == QtCore.Qt.Key_Enter
@@ -1015,15 +2056,19 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
             self.refresh_left_list()
 
     def get_file_creation_time(self, filename):
-        """ファイルの作成日時を取得"""
+        """ファイルの作成日時を取得（スキャン時のstat結果を再利用）"""
+        cached = self._ctime_cache.get(filename)
+        if cached is not None:
+            return cached
         try:
-            filepath = os.path.join(self.image_folder, filename)
+            filepath = self._folder_prefix + filename
             return os.path.getctime(filepath)
         except:
             return 0
 
     def get_group_creation_time(self, group_key):
         """グループの代表ファイル（最初のファイル）の作成日時を取得"""
+        self._ensure_group_sorted(group_key)
         filelist = self.group_dict.get(group_key, [])
         if not filelist:
             return 0
@@ -1040,42 +2085,80 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
     def get_middle_group_first_file(self, left_key, middle_key):
         """中間グループの最初のファイルを取得"""
-        filelist = self.group_dict.get(left_key, [])
-        middle_groups = self.get_middle_groups(filelist)
+        middle_groups = self.middle_groups_for(left_key)
         files = middle_groups.get(middle_key, [])
         return files[0] if files else None
 
     def refresh_left_list(self):
         """左リストを再描画"""
         # 現在の選択を記憶
-        current_item = self.left_list.currentItem()
-        current_key = current_item.text() if current_item else None
+        current_key = self.left_list.current_key()
 
         # ソート
         if self.sort_order == "date":
             # 作成日順（新しい順）
             self.group_keys = sorted(
                 self.group_dict.keys(),
-                key=lambda k: self.get_group_creation_time(k),
+                key=self.get_group_creation_time,
                 reverse=True,
             )
         else:
             # ファイル名順
             self.group_keys = sorted(self.group_dict.keys(), key=self.natural_key)
 
-        # 左リスト更新
-        self.left_list.clear()
-        for key in self.group_keys:
-            self.left_list.addItem(key)
+        # 左リスト更新（モデルの列差し替え1回で済む）
+        self.left_list.set_rows(self.group_keys)
 
         # 前回の選択を復元
         if current_key:
-            items = self.left_list.findItems(current_key, QtCore.Qt.MatchExactly)
-            if items:
-                self.left_list.setCurrentItem(items[0])
+            try:
+                self.left_list.setCurrentRow(self.group_keys.index(current_key))
+            except ValueError:
+                if self.group_keys:
+                    self.left_list.setCurrentRow(0)
         elif self.group_keys:
             self.left_list.setCurrentRow(0)
 
+    # ファイル一覧キャッシュのフォーマット版数（形式変更時に上げる）
+    FILELIST_CACHE_VERSION = 3
+
+    def _load_filelist_cache(self, folder):
+        """ディレクトリが未変更ならキャッシュされた(一覧, 作成日時, サイズ)を返す"""
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+            with open(self._filelist_cache_path, "r", encoding="utf-8") as f:
+                header = f.readline().rstrip("\n")
+                if header != f"{self.FILELIST_CACHE_VERSION}\t{folder}\t{mtime_ns}":
+                    return None
+                image_files = []
+                ctime_cache = {}
+                size_cache = {}
+                for line in f.read().splitlines():
+                    name, ctime, size = line.split("\t")
+                    image_files.append(name)
+                    ctime_cache[name] = float(ctime)
+                    size_cache[name] = int(size)
+                return image_files, ctime_cache, size_cache
+        except (OSError, ValueError):
+            return None
+
+    def _save_filelist_cache(self, folder, image_files, ctime_cache, size_cache):
+        """スキャン結果をディレクトリのmtime付きでキャッシュに書き出す"""
+        try:
+            mtime_ns = os.stat(folder).st_mtime_ns
+            self._filelist_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._filelist_cache_path, "w", encoding="utf-8") as f:
+                f.write(f"{self.FILELIST_CACHE_VERSION}\t{folder}\t{mtime_ns}\n")
+                f.write(
+                    "\n".join(
+                        f"{name}\t{ctime_cache.get(name, 0)}"
+                        f"\t{size_cache.get(name, 0)}"
+                        for name in image_files
+                    )
+                )
+        except OSError as e:
+            print(f"ファイル一覧キャッシュの保存に失敗: {e}")
+
     def scan_folder(self):
         """フォルダをスキャンして画像を読み込み"""
         folder = self.folder_input.text()
@@ -1093,120 +2176,268 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
             return
 
         self.image_folder = folder
+        # ホットパスでのos.path.join呼び出しを避けるための連結用プレフィックス
+        self._folder_prefix = folder.rstrip("/") + "/"
         self.save_settings()
 
+        # スキャン本体はワーカースレッドで実行し、ウィンドウ表示や入力を
+        # ブロックしない。結果はシグナル経由でGUIスレッドに戻す。
+        # 世代番号で古いスキャンの結果を無効化し、完了までボタンを止めて
+        # 同じフォルダへの多重スキャンも防ぐ
+        self._scan_generation += 1
+        self.scan_btn.setEnabled(False)
+        self.statusBar().showMessage("スキャン中...")
+        threading.Thread(
+            target=self._scan_thread,
+            args=(folder, self._scan_generation),
+            daemon=True,
+        ).start()
+
+    def _scan_thread(self, folder, generation):
+        """ワーカースレッドでの列挙+グループ化（Qtウィジェットに触らない）"""
         try:
-            # ファイル一覧取得
-            all_files = os.listdir(folder)
-            valid_exts = (".jpg", ".jpeg", ".png", ".gif", ".bmp", ".webp")
-            image_files = [f for f in all_files if f.lower().endswith(valid_exts)]
-
-            if not image_files:
-                QtWidgets.QMessageBox.information(
-                    self, "情報", "画像ファイルが見つかりませんでした"
+            # ディレクトリ未変更なら前回のスキャン結果を再利用する
+            cached = self._load_filelist_cache(folder)
+
+            if cached is not None:
+                image_files, ctime_cache, size_cache = cached
+            else:
+                # ファイル一覧取得（scandirで1回のシステムコールにまとめる）。
+                # 拡張子だけlower()して全ファイル名の小文字コピー生成を避ける。
+                # 作成日時とサイズもDirEntry.stat()からこのパスで取り切って
+                # おき、ソート・表示・先読み順序付けでのstatをなくす
+                image_files = []
+                ctime_cache = {}
+                size_cache = {}
+                with os.scandir(folder) as it:
+                    for e in it:
+                        name = e.name
+                        dot = name.rfind(".")
+                        if (
+                            dot >= 0
+                            and name[dot:].lower() in _VALID_EXTS
+                            and e.is_file(follow_symlinks=False)
+                        ):
+                            image_files.append(name)
+                            try:
+                                st = e.stat(follow_symlinks=False)
+                            except OSError:
+                                continue
+                            ctime_cache[name] = st.st_ctime
+                            size_cache[name] = st.st_size
+                self._save_filelist_cache(
+                    folder, image_files, ctime_cache, size_cache
                 )
-                return
 
-            # グループ化
-            self.group_dict = {}
+            # グループ化（表示名もこのパスで1回だけ計算しておく）
+            group_dict = defaultdict(list)
+            display_name_cache = {}
             for filename in image_files:
-                prefix = filename.split("_")[0]
-                self.group_dict.setdefault(prefix, []).append(filename)
-
-            # グループ内は常に番号順にソート
-            for key in self.group_dict.keys():
-                self.group_dict[key].sort(key=self.natural_key)
+                # プレフィックスだけ必要なのでpartitionでリスト生成を避ける
+                prefix = filename.partition("_")[0]
+                group_dict[prefix].append(filename)
+
+                # 表示名もfindのオフセット計算だけで切り出し、ファイル
+                # ごとの分割リスト生成を避ける
+                i1 = filename.find("_")
+                i2 = filename.find("_", i1 + 1) if i1 >= 0 else -1
+                display_name = filename[i2 + 1:] if i2 >= 0 else filename
+                # splitext同様、先頭のドット連なりは拡張子とみなさない
+                # （第3フィールドが「.png」だけの名前を空にしない）
+                dot = display_name.rfind(".")
+                if dot > 0 and display_name[:dot].lstrip("."):
+                    display_name = display_name[:dot]
+                display_name_cache[filename] = display_name
+
+            # ソートキーをこのスレッドで温めておく。GUI側の遅延ソートや
+            # 左リストの並べ替えはlru_cacheのヒットだけになる
+            for filename in image_files:
+                natural_key(filename)
+            for prefix in group_dict:
+                natural_key(prefix)
 
-            # 左リスト更新（ソート順に応じて）
-            self.refresh_left_list()
+            self.scan_finished.emit(
+                generation, folder, group_dict, display_name_cache,
+                ctime_cache, size_cache, ""
+            )
+        except Exception as e:
+            self.scan_finished.emit(
+                generation, folder, None, None, None, None, str(e)
+            )
 
-            # 中・右リストクリア
-            self.middle_list.clear()
-            self.right_list.clear()
-            self.preview_widget.clear_image()
+    def _on_scan_finished(
+        self, generation, folder, group_dict, display_name_cache,
+        ctime_cache, size_cache, error
+    ):
+        """スキャン完了をGUIスレッドで受けてリストを更新"""
+        # 後から始まったスキャンがある場合、この結果はもう古い
+        if generation != self._scan_generation:
+            return
 
-            self.statusBar().showMessage(
-                f"{len(image_files)}個の画像ファイルを読み込みました"
+        self.scan_btn.setEnabled(True)
+        if error:
+            QtWidgets.QMessageBox.critical(
+                self, "エラー", f"フォルダのスキャンに失敗しました:\n{error}"
             )
+            return
 
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(
-                self, "エラー", f"フォルダのスキャンに失敗しました:\n{e}"
+        if not group_dict:
+            QtWidgets.QMessageBox.information(
+                self, "情報", "画像ファイルが見つかりませんでした"
             )
+            return
+
+        self.group_dict = group_dict
+        self._middle_groups_cache.clear()
+        self._group_files_cache.clear()
+        self._middle_texts_cache.clear()
+        self._display_name_cache = display_name_cache
+        self._ctime_cache = ctime_cache
+        self._size_cache = size_cache
+
+        # グループ内のソートは初回アクセス時まで遅延する
+        # （1セッションで見るグループは一部だけなので起動時に全てを
+        # ソートするのは無駄になる）
+        self._sorted_groups.clear()
+
+        # 左リスト更新（ソート順に応じて）
+        self.refresh_left_list()
+
+        # 中・右リストクリア（選択ミラーも新しいgroup_dict基準でリセット。
+        # 直後にデバウンス経由の_do_left_selectが設定し直す）
+        self._current_left_key = None
+        self._current_middle_key = None
+        self.middle_list.clear()
+        self.right_list.clear()
+        self.preview_widget.clear_image()
+
+        self.statusBar().showMessage(
+            f"{len(display_name_cache)}個の画像ファイルを読み込みました"
+        )
 
     def on_left_select(self):
-        """左リスト選択時"""
-        item = self.left_list.currentItem()
-        if not item:
+        """左リスト選択時（デバウンスして確定後に処理）"""
+        self._left_select_timer.start()
+
+    def select_group_rows(self, left_row=None, middle_row=None):
+        """左・中リストの選択をまとめて適用する
+
+        setCurrentRowごとにシグナル→デバウンス→再構築の連鎖を走らせる
+        代わりに、シグナルを止めて行だけ動かし、実処理を直接1回ずつ呼ぶ。
+        middle_rowは負数なら末尾からの位置（-1で最後の行）。
+        """
+        if left_row is not None:
+            self.left_list.blockSignals(True)
+            try:
+                self.left_list.setCurrentRow(left_row)
+            finally:
+                self.left_list.blockSignals(False)
+            self._left_select_timer.stop()
+            self._do_left_select()
+
+        if middle_row is not None:
+            if middle_row < 0:
+                middle_row += self.middle_list.count()
+            self.middle_list.blockSignals(True)
+            try:
+                self.middle_list.setCurrentRow(middle_row)
+            finally:
+                self.middle_list.blockSignals(False)
+            self._middle_select_timer.stop()
+            self._do_middle_select()
+
+    def _do_left_select(self):
+        """左リスト選択の実処理"""
+        group_key = self.left_list.current_key()
+        self._current_left_key = group_key
+        if group_key is None:
+            self._current_middle_key = None
             self.middle_list.clear()
             self.right_list.clear()
             self.preview_widget.clear_image()
             return
 
-        group_key = item.text()
-        filelist = self.group_dict.get(group_key, [])
-        middle_groups = self.get_middle_groups(filelist)
-        sorted_middle_keys = sorted(middle_groups.keys(), key=self.natural_key)
-
-        self.middle_list.clear()
-        for k in sorted_middle_keys:
-            # 中間グループの最初のファイルの作成日時を取得
-            first_file = self.get_middle_group_first_file(group_key, k)
-            if first_file:
-                date_str = self.format_creation_time(first_file)
-                display_text = f"{k}    {date_str}"
-            else:
-                display_text = k
+        sorted_middle_keys = self.sorted_middle_keys_for(group_key)
+
+        # 表示文字列の列を組み立ててモデルへ一括差し替え。日付の整形は
+        # 左キーごとに1回で済むようキャッシュする。リセット中の選択
+        # シグナルは止め、最後のsetCurrentRowで1回だけ連鎖させる
+        texts = self._middle_texts_cache.get(group_key)
+        if texts is None:
+            texts = []
+            for k in sorted_middle_keys:
+                # 中間グループの最初のファイルの作成日時を取得
+                first_file = self.get_middle_group_first_file(group_key, k)
+                if first_file:
+                    date_str = self.format_creation_time(first_file)
+                    texts.append(f"{k}    {date_str}")
+                else:
+                    texts.append(k)
+            self._middle_texts_cache[group_key] = texts
 
-            item = QtWidgets.QListWidgetItem(display_text)
-            # データとして元のキーを保存
-            item.setData(QtCore.Qt.UserRole, k)
-            self.middle_list.addItem(item)
+        self.middle_list.blockSignals(True)
+        try:
+            self.middle_list.set_rows(texts, sorted_middle_keys)
+        finally:
+            self.middle_list.blockSignals(False)
 
         self.right_list.clear()
         self.preview_widget.clear_image()
 
-        # 中リストの最初を選択
+        # 中リストの最初を選択（ミラーも先に合わせておく）
+        self._current_middle_key = (
+            sorted_middle_keys[0] if sorted_middle_keys else None
+        )
         if sorted_middle_keys:
             self.middle_list.setCurrentRow(0)
 
     def on_middle_select(self):
-        """中リスト選択時"""
-        left_item = self.left_list.currentItem()
-        middle_item = self.middle_list.currentItem()
+        """中リスト選択時（デバウンスして確定後に処理）"""
+        self._middle_select_timer.start()
+
+    def _do_middle_select(self):
+        """中リスト選択の実処理"""
+        left_key = self._current_left_key
+        middle_key = self.middle_list.current_key()
+        self._current_middle_key = middle_key
 
-        if not left_item or not middle_item:
+        if left_key is None or middle_key is None:
             self.right_list.clear()
             self.preview_widget.clear_image()
             return
 
-        left_key = left_item.text()
-        # UserRoleから元のキーを取得--++--++
-        middle_key = middle_item.data(QtCore.Qt.UserRole)
-        filelist = self.group_dict.get(left_key, [])
-
-        self.update_right_list(middle_key, filelist)
+        self.update_right_list(middle_key, left_key)
 
     def on_right_select(self):
-        """右リスト選択時（プレビュー更新）"""
+        """右リスト選択時（デバウンスして確定後に処理）"""
+        self._right_select_timer.start()
+
+    def _do_right_select(self):
+        """右リスト選択の実処理（プレビュー更新）"""
         filepath = self.get_current_filepath()
         if filepath:
             self.preview_widget.set_image(filepath)
         else:
             self.preview_widget.clear_image()
 
-    def update_right_list(self, middle_key, filelist):
+    def update_right_list(self, middle_key, left_key):
         """右リスト更新"""
-        middle_groups = self.get_middle_groups(filelist)
+        middle_groups = self.middle_groups_for(left_key)
         files = middle_groups.get(middle_key, [])
 
-        self.right_list.clear()
-        for f in files:
-            parts = f.split("_", 2)
-            display_name = parts[2] if len(parts) > 2 else f
-            if "." in display_name:
-                display_name = os.path.splitext(display_name)[0]
-            self.right_list.addItem(display_name)
+        display_name_cache = self._display_name_cache
+        display_names = [display_name_cache.get(f, f) for f in files]
+
+        # クリア時の一時的な「選択なし」シグナルでプレビューを
+        # チラつかせないよう、挿入が終わるまでシグナルを止める
+        self.right_list.setUpdatesEnabled(False)
+        self.right_list.blockSignals(True)
+        try:
+            self.right_list.clear()
+            self.right_list.addItems(display_names)
+        finally:
+            self.right_list.blockSignals(False)
+            self.right_list.setUpdatesEnabled(True)
 
         # 右リストの最初を選択
         if files:
@@ -1214,24 +2445,18 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
     def get_current_filepath(self):
         """現在選択中の画像ファイルパスを取得"""
-        left_item = self.left_list.currentItem()
-        middle_item = self.middle_list.currentItem()
-        right_item = self.right_list.currentItem()
+        left_key = self._current_left_key
+        middle_key = self._current_middle_key
+        right_idx = self.right_list.currentRow()
 
-        if not (left_item and middle_item and right_item):
+        if left_key is None or middle_key is None or right_idx < 0:
             return None
 
-        left_key = left_item.text()
-        # UserRoleから元のキーを取得
-        middle_key = middle_item.data(QtCore.Qt.UserRole)
-        right_idx = self.right_list.currentRow()
-
-        filelist = self.group_dict.get(left_key, [])
-        middle_groups = self.get_middle_groups(filelist)
+        middle_groups = self.middle_groups_for(left_key)
         files = middle_groups.get(middle_key, [])
 
         if 0 <= right_idx < len(files):
-            return os.path.join(self.image_folder, files[right_idx])
+            return self._folder_prefix + files[right_idx]
 
         return None
 
@@ -1241,63 +2466,142 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
         if not filepath:
             # 左・中リストの場合は最初のファイルを開く
             if list_widget == self.left_list:
-                item = self.left_list.currentItem()
-                if item:
-                    filelist = self.group_dict.get(item.text(), [])
+                group_key = self._current_left_key
+                if group_key is not None:
+                    self._ensure_group_sorted(group_key)
+                    filelist = self.group_dict.get(group_key, [])
                     if filelist:
-                        filepath = os.path.join(self.image_folder, filelist[0])
+                        filepath = self._folder_prefix + filelist[0]
             elif list_widget == self.middle_list:
-                left_item = self.left_list.currentItem()
-                middle_item = self.middle_list.currentItem()
-                if left_item and middle_item:
-                    filelist = self.group_dict.get(left_item.text(), [])
-                    middle_key = middle_item.data(QtCore.Qt.UserRole)
-                    middle_groups = self.get_middle_groups(filelist)
+                left_key = self._current_left_key
+                middle_key = self._current_middle_key
+                if left_key is not None and middle_key is not None:
+                    middle_groups = self.middle_groups_for(left_key)
                     files = middle_groups.get(middle_key, [])
                     if files:
-                        filepath = os.path.join(self.image_folder, files[0])
+                        filepath = self._folder_prefix + files[0]
 
         if filepath and os.path.exists(filepath):
-            try:
-                subprocess.run(["open", filepath], check=True)
-            except Exception as e:
+            # openコマンドのfork/execを挟まず、Qtから既定アプリに渡す
+            # （プロセス起動なし・非ブロッキング・プラットフォーム非依存）
+            ok = QtGui.QDesktopServices.openUrl(
+                QtCore.QUrl.fromLocalFile(filepath)
+            )
+            if not ok:
                 QtWidgets.QMessageBox.critical(
-                    self, "エラー", f"画像を開けませんでした:\n{e}"
+                    self, "エラー", "画像を開けませんでした"
                 )
 
     def move_selection(self, list_widget, direction):
         """リストの選択を移動"""
-        if list_widget.count() == 0:
+        last = list_widget.count() - 1
+        if last < 0:
             return
 
         current = list_widget.currentRow()
         if current == -1:
-            new_index = 0 if direction > 0 else list_widget.count() - 1
+            new_index = 0 if direction > 0 else last
         else:
+            # 条件式でのクランプ（max/minの呼び出し2回より分岐2つが安い）
             new_index = current + direction
-            new_index = max(0, min(new_index, list_widget.count() - 1))
+            new_index = 0 if new_index < 0 else last if new_index > last else new_index
+            if new_index == current:
+                return
 
         list_widget.setCurrentRow(new_index)
 
     def reveal_in_finder(self):
         """現在のファイルをFinderで選択表示"""
         filepath = self.get_current_filepath()
-        if not filepath or not os.path.exists(filepath):
+        if not filepath:
             self.statusBar().showMessage("ファイルが選択されていません")
             return
 
-        try:
-            # AppleScriptでFinderを開いてファイルを選択
-            script = f'tell application "Finder" to reveal POSIX file "{filepath}"'
-            subprocess.run(["osascript", "-e", script], check=True)
-            # Finderを前面に
-            subprocess.run(
-                ["osascript", "-e", 'tell application "Finder" to activate'], check=True
+        # iCloudやSMB上のファイルはstat1回で数秒待たされることがある。
+        # 存在確認（と初回のスクリプトコンパイル）はワーカースレッドで
+        # 済ませ、結果だけシグナルでGUIスレッドへ戻す
+        def check():
+            exists = os.path.exists(filepath)
+            script = (
+                self._reveal_script()
+                if exists and _NSWorkspace is None
+                else None
             )
-            self.statusBar().showMessage(f"Finderで表示: {os.path.basename(filepath)}")
-        except Exception as e:
+            self.reveal_checked.emit(filepath, exists, script)
+
+        threading.Thread(target=check, daemon=True).start()
+
+    def _do_reveal(self, filepath, exists, script_path):
+        """存在確認済みのファイルをFinderで表示（GUIスレッド）"""
+        if not exists:
+            self.statusBar().showMessage("ファイルが見つかりません")
+            return
+
+        # PyObjC経由ならFinderへの指示がこのプロセス内で完結する
+        if _NSWorkspace is not None:
+            _NSWorkspace.sharedWorkspace().activateFileViewerSelectingURLs_(
+                [_NSURL.fileURLWithPath_(filepath)]
+            )
+            self.statusBar().showMessage(
+                f"Finderで表示: {os.path.basename(filepath)}"
+            )
+            return
+
+        # コンパイル済みスクリプトがあればパスを引数で渡すだけで済む
+        # （パースが不要になり、AppleScript向けのエスケープも要らない）
+        if script_path is not None:
+            args = [str(script_path), filepath]
+        else:
+            # osacompileが使えない環境ではソースをその場で渡す
+            quoted = filepath.replace("\\", "\\\\").replace('"', '\\"')
+            args = [
+                "-e",
+                'tell application "Finder"\n'
+                "activate\n"
+                f'reveal POSIX file "{quoted}"\n'
+                "end tell",
+            ]
+
+        # subprocess.runで待つとosascriptの往復の間イベントループが
+        # 止まるため、QProcessで投げっぱなしにして結果はシグナルで受ける
+        proc = QtCore.QProcess(self)
+        proc.finished.connect(
+            lambda code, _status, p=proc: self._on_reveal_finished(p, code)
+        )
+        proc.start("osascript", args)
+        self.statusBar().showMessage(f"Finderで表示: {os.path.basename(filepath)}")
+
+    # Finder表示用AppleScript。パスはargvで受けるので補間不要
+    _REVEAL_SCRIPT_SOURCE = (
+        "on run argv\n"
+        'tell application "Finder"\n'
+        "activate\n"
+        "reveal POSIX file (item 1 of argv)\n"
+        "end tell\n"
+        "end run"
+    )
+
+    def _reveal_script(self):
+        """コンパイル済みreveal.scptのパスを返す（初回呼び出し時に生成）"""
+        path = self._filelist_cache_path.parent / "reveal.scpt"
+        if not path.exists():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                subprocess.run(
+                    ["osacompile", "-o", str(path), "-e", self._REVEAL_SCRIPT_SOURCE],
+                    check=True,
+                )
+            except Exception:
+                return None
+        return path
+
+    def _on_reveal_finished(self, proc, exit_code):
+        """Finder表示の完了（失敗時のみダイアログを出す）"""
+        error = bytes(proc.readAllStandardError()).decode(errors="replace").strip()
+        proc.deleteLater()
+        if exit_code != 0:
             QtWidgets.QMessageBox.critical(
-                self, "エラー", f"Finderで開けませんでした:\n{e}"
+                self, "エラー", f"Finderで開けませんでした:\n{error or exit_code}"
             )
 
     def move_to_next_middle_group(self):
@@ -1307,8 +2611,8 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
         current_row = self.middle_list.currentRow()
         if current_row < self.middle_list.count() - 1:
-            # 次のグループに移動
-            self.middle_list.setCurrentRow(current_row + 1)
+            # 次のグループに移動（シグナル連鎖を1回にまとめて適用）
+            self.select_group_rows(middle_row=current_row + 1)
         else:
             # 最後のグループ → 左リストの次に移動
             self.move_to_next_left_group()
@@ -1320,8 +2624,8 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
         current_row = self.middle_list.currentRow()
         if current_row > 0:
-            # 前のグループに移動
-            self.middle_list.setCurrentRow(current_row - 1)
+            # 前のグループに移動（シグナル連鎖を1回にまとめて適用）
+            self.select_group_rows(middle_row=current_row - 1)
         else:
             # 最初のグループ → 左リストの前に移動
             self.move_to_prev_left_group()
@@ -1333,11 +2637,8 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
         current_row = self.left_list.currentRow()
         if current_row < self.left_list.count() - 1:
-            # 次のグループに移動
-            self.left_list.setCurrentRow(current_row + 1)
-            # 中リストの最初を選択
-            if self.middle_list.count() > 0:
-                self.middle_list.setCurrentRow(0)
+            # 次の左グループ＋中リスト先頭をまとめて選択
+            self.select_group_rows(left_row=current_row + 1, middle_row=0)
 
     def move_to_prev_left_group(self):
         """前の左グループに移動"""
@@ -1346,70 +2647,170 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
         current_row = self.left_list.currentRow()
         if current_row > 0:
-            # 前のグループに移動
-            self.left_list.setCurrentRow(current_row - 1)
-            # 中リストの最後を選択
-            if self.middle_list.count() > 0:
-                self.middle_list.setCurrentRow(self.middle_list.count() - 1)
-
-    @staticmethod
-    def natural_key(s):
-        """自然順ソート用キー"""
-
-        def try_int(c):
-            try:
-                return int(c)
-            except:
-                return c
-
-        return [try_int(c) for c in re.split(r"(\d+)", s)]
+            # 前の左グループ＋中リスト末尾をまとめて選択
+            self.select_group_rows(left_row=current_row - 1, middle_row=-1)
 
-    @staticmethod
-    def extract_middle_number(name):
-        """ファイル名から中間番号を抽出"""
-        parts = name.split("_")
-        if len(parts) >= 3:
-            return parts[1]
-        return ""
+    # 自然順ソートキーと中間番号抽出（モジュールレベルの関数を共用）
+    natural_key = staticmethod(natural_key)
+    extract_middle_number = staticmethod(_extract_middle_number)
 
     def get_middle_groups(self, filelist):
         """中間グループ化"""
-        middle_group_dict = {}
+        # 数万件規模では分割とグループ化をpandasのC実装に任せた方が速い。
+        # キーの決め方は下のPythonループと同じ（区切りが2つ未満なら空）
+        if _pd is not None and len(filelist) > 10000:
+            series = _pd.Series(filelist)
+            parts = series.str.split("_", n=2)
+            keys = parts.str[1].where(parts.str.len() >= 3, "")
+            return {k: g.tolist() for k, g in series.groupby(keys)}
+
+        # setdefaultのキーごとの空リスト生成を避ける（スキャン側の
+        # グループ化と同じくdefaultdictで1パス）
+        middle_group_dict = defaultdict(list)
+        extract = _extract_middle_number
         for f in filelist:
-            key = self.extract_middle_number(f)
-            middle_group_dict.setdefault(key, []).append(f)
+            middle_group_dict[extract(f)].append(f)
         return middle_group_dict
 
+    def _ensure_group_sorted(self, left_key):
+        """グループ内ファイルリストを初回アクセス時に番号順ソート"""
+        if left_key not in self._sorted_groups:
+            filelist = self.group_dict.get(left_key)
+            if filelist is not None:
+                # ソート後はタプルに固定（イテレーションが速く、誤った
+                # 変更でキャッシュと食い違うことも防げる）
+                self.group_dict[left_key] = tuple(
+                    sorted(filelist, key=self.natural_key)
+                )
+            self._sorted_groups.add(left_key)
+
+    def _middle_entry_for(self, left_key):
+        """左キーに対応する (ソート済み中間キー, 中間グループ辞書) を取得
+
+        結果はleft_keyごとにメモ化され、フォルダ再スキャン時に
+        _middle_groups_cacheごと破棄される。ナビゲーション中の参照は
+        全て辞書ヒットで済む。
+        """
+        entry = self._middle_groups_cache.get(left_key)
+        if entry is None:
+            self._ensure_group_sorted(left_key)
+            middle_groups = self.get_middle_groups(self.group_dict.get(left_key, []))
+            sorted_keys = sorted(middle_groups.keys(), key=self.natural_key)
+            entry = (sorted_keys, middle_groups)
+            self._middle_groups_cache[left_key] = entry
+        return entry
+
+    def middle_groups_for(self, left_key):
+        """左キーに対応する中間グループ分けを取得（キャッシュ付き）"""
+        return self._middle_entry_for(left_key)[1]
+
+    def group_files_for(self, left_key, middle_key):
+        """グループ内ファイルの(フルパス, ファイル名, 小文字拡張子)列を取得
+
+        キー操作のたびにsplitext/basename/joinを全ファイルへ掛け直さずに
+        済むよう、グループ単位でタプル列を組み立ててキャッシュする。
+        """
+        key = (left_key, middle_key)
+        cached = self._group_files_cache.get(key)
+        if cached is None:
+            prefix = self._folder_prefix
+            cached = []
+            for f in self.middle_groups_for(left_key).get(middle_key, []):
+                dot = f.rfind(".")
+                ext = f[dot:].lower() if dot != -1 else ""
+                cached.append((prefix + f, f, ext))
+            self._group_files_cache[key] = cached
+        return cached
+
+    def sorted_middle_keys_for(self, left_key):
+        """左キーに対応するソート済み中間キーを取得（キャッシュ付き）"""
+        return self._middle_entry_for(left_key)[0]
+
     def load_settings(self):
         """設定を読み込み"""
         if self.config_path.exists():
             try:
-                with open(self.config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    self.image_folder = config.get("folder", "")
-                    if self.image_folder:
-                        self.folder_input.setText(self.image_folder)
-
-                    # ソート順を復元
-                    self.sort_order = config.get("sort_order", "name")
-                    if self.sort_order == "date":
-                        self.sort_date_radio.setChecked(True)
-                    else:
-                        self.sort_name_radio.setChecked(True)
-
-                    # ショートカットキーを復元
-                    # self.shortcut_manager.load_from_config(config)
+                # ファイルが前回読んだときから変わっていなければ、
+                # パース済みの内容をそのまま使う
+                mtime = self.config_path.stat().st_mtime_ns
+                if (
+                    self._last_saved_config is not None
+                    and mtime == self._config_mtime_ns
+                ):
+                    config = self._last_saved_config
+                else:
+                    config = _json_loads(self.config_path.read_bytes())
+                    self._config_mtime_ns = mtime
+                self._last_saved_config = config
+                self.image_folder = config.get("folder", "")
+                if self.image_folder:
+                    self.folder_input.setText(self.image_folder)
+
+                # ソート順を復元
+                self.sort_order = config.get("sort_order", "name")
+                if self.sort_order == "date":
+                    self.sort_date_radio.setChecked(True)
+                else:
+                    self.sort_name_radio.setChecked(True)
+
+                # 先読み枚数を復元
+                self.preview_widget.preload_backward = int(
+                    config.get("preload_backward", 3)
+                )
+                self.preview_widget.preload_forward = int(
+                    config.get("preload_forward", 7)
+                )
+
+                # APNGキャッシュの予算（MB）を復元
+                cache_mb = config.get("apng_cache_mb")
+                if cache_mb:
+                    _SHARED_APNG_CACHE.max_bytes = int(cache_mb) * 1024 * 1024
+
+                # ショートカットキーを復元
+                # self.shortcut_manager.load_from_config(config)
             except Exception as e:
                 print(f"設定の読み込みに失敗: {e}")
 
     def save_settings(self):
+        """設定の保存を予約（連続する変更は1回の書き込みにまとめる）"""
+        self._save_timer.start()
+
+    def _do_save_settings(self):
         """設定を保存"""
         try:
-            config = {"folder": self.image_folder, "sort_order": self.sort_order}
+            config = {
+                "folder": self.image_folder,
+                "sort_order": self.sort_order,
+                "apng_cache_mb": _SHARED_APNG_CACHE.max_bytes // (1024 * 1024),
+                "preload_backward": self.preview_widget.preload_backward,
+                "preload_forward": self.preview_widget.preload_forward,
+            }
             # ショートカットキーを保存
             # self.shortcut_manager.save_to_config(config)
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+
+            # 内容が前回と同じなら書かない（iCloud同期の無駄な発火も防ぐ）
+            if config == self._last_saved_config:
+                return
+
+            # 一時ファイルに書いてからrenameする。書き込み途中での異常
+            # 終了や同期で設定ファイルが壊れた状態にならない
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_path.parent, suffix=".tmp"
+            )
+            try:
+                if _orjson is not None:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(
+                            _orjson.dumps(config, option=_orjson.OPT_INDENT_2)
+                        )
+                else:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(config, f, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.config_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._last_saved_config = config
         except Exception as e:
             print(f"設定の保存に失敗: {e}")
 
@@ -1427,12 +2828,18 @@ class ImageGroupNavigator(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         """ウィンドウを閉じる時"""
-        self.save_settings()
+        self._save_timer.stop()
+        self._do_save_settings()
+        _save_apng_disk_cache()
+        self.preview_widget.cleanup()
         event.accept()
 
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
+    # 静止画ピクスマップはアプリ全体で共有するQPixmapCacheに載せる。
+    # 上限256MBで、プレビューとフルスクリーンの二重保持を防ぐ
+    QtGui.QPixmapCache.setCacheLimit(256 * 1024)
     window = ImageGroupNavigator()
     window.show()
     sys.exit(app.exec())